@@ -0,0 +1,7 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.cache.chunk_cache import ChunkCache  # noqa
+from quackling.core.cache.chunking import chunk_document  # noqa
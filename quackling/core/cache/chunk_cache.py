@@ -0,0 +1,160 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+from docling_core.types import Document as DLDocument
+
+from quackling.core.chunkers.base import BaseChunker, Chunk, ChunkWithMetadata
+
+_CACHE_FORMAT_VERSION = 1
+_CHUNK_TYPES: dict[str, type[Chunk]] = {
+    cls.__name__: cls for cls in (Chunk, ChunkWithMetadata)
+}
+
+
+class ChunkCache:
+    """Persistent cache of chunking results, backed by a SQLite file.
+
+    Entries are keyed by document hash and a fingerprint of the chunker config,
+    stored compressed, and evicted in least-recently-used order once
+    `max_entries` or `max_size_bytes` (of compressed payload) is exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int | None = None,
+        max_size_bytes: int | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # as every hit updates its access time, avoid an fsync per transaction and
+        # let readers proceed concurrently with a writer
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._conn:
+            # must be set before the first table is created to take effect
+            self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS chunks_last_access "
+                "ON chunks (last_access)"
+            )
+
+    @classmethod
+    def fingerprint(cls, chunker: BaseChunker, **kwargs: Any) -> str:
+        config = {
+            "version": _CACHE_FORMAT_VERSION,
+            "chunker": f"{type(chunker).__module__}.{type(chunker).__qualname__}",
+            "params": chunker.model_dump(mode="json"),
+            "kwargs": kwargs,
+        }
+        return hashlib.sha256(
+            json.dumps(config, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def _create_key(cls, doc_hash: str, fingerprint: str) -> str:
+        return f"{doc_hash}/{fingerprint}"
+
+    def get(self, doc_hash: str, fingerprint: str) -> list[Chunk] | None:
+        key = self._create_key(doc_hash=doc_hash, fingerprint=fingerprint)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM chunks WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE chunks SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        return [
+            _CHUNK_TYPES[entry["type"]].model_validate(entry["chunk"])
+            for entry in json.loads(zlib.decompress(row[0]))
+        ]
+
+    def put(self, doc_hash: str, fingerprint: str, chunks: list[Chunk]) -> None:
+        key = self._create_key(doc_hash=doc_hash, fingerprint=fingerprint)
+        data = zlib.compress(
+            json.dumps(
+                [
+                    {"type": type(c).__name__, "chunk": c.model_dump(mode="json")}
+                    for c in chunks
+                ]
+            ).encode("utf-8")
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        evicted = 0
+        if self._max_entries is not None:
+            evicted += self._conn.execute(
+                "DELETE FROM chunks WHERE key IN (SELECT key FROM chunks "
+                "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            ).rowcount
+        if self._max_size_bytes is not None:
+            # keep the most recently used entries fitting in the size budget
+            evicted += self._conn.execute(
+                "DELETE FROM chunks WHERE key IN (SELECT key FROM ("
+                "SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) "
+                "AS cum_size FROM chunks) WHERE cum_size > ?)",
+                (self._max_size_bytes,),
+            ).rowcount
+        if evicted:
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def get_or_chunk(
+        self,
+        chunker: BaseChunker,
+        doc_hash: str | None,
+        load_doc: Callable[[], DLDocument],
+        **kwargs: Any,
+    ) -> list[Chunk]:
+        """Return cached chunks, loading and chunking the document only on a miss."""
+        fingerprint = self.fingerprint(chunker, **kwargs)
+        if doc_hash and (chunks := self.get(doc_hash, fingerprint)) is not None:
+            return chunks
+        dl_doc = load_doc()
+        chunks = list(chunker.chunk(dl_doc=dl_doc, **kwargs))
+        if doc_hash := doc_hash or dl_doc.file_info.document_hash:
+            self.put(doc_hash, fingerprint, chunks)
+        return chunks
+
+    def compact(self) -> None:
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM chunks")
+        self.compact()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,52 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from typing import Any, Callable, Iterable
+
+from docling_core.types import Document as DLDocument
+
+from quackling.core.cache.chunk_cache import ChunkCache
+from quackling.core.chunkers.base import BaseChunker, Chunk
+from quackling.core.provenance import ProvenanceIndexStore
+
+
+def chunk_document(
+    chunker: BaseChunker,
+    doc_hash: str | None,
+    load_doc: Callable[[], DLDocument],
+    chunk_cache: ChunkCache | None = None,
+    prov_index_store: ProvenanceIndexStore | None = None,
+    **kwargs: Any,
+) -> tuple[str, Iterable[Chunk]]:
+    """Chunk a document, going through the cache and building its provenance index.
+
+    The document is only loaded if its chunks are not cached or its provenance
+    index is missing. Returns the document hash (taken from the loaded document if
+    not given) along with the chunks.
+    """
+
+    def _load() -> DLDocument:
+        nonlocal doc_hash
+        dl_doc = load_doc()
+        doc_hash = doc_hash or dl_doc.file_info.document_hash
+        if prov_index_store is not None:
+            prov_index_store.put(dl_doc)
+        return dl_doc
+
+    chunks: Iterable[Chunk]
+    if chunk_cache is None:
+        chunks = chunker.chunk(dl_doc=_load(), **kwargs)
+    else:
+        chunks = chunk_cache.get_or_chunk(
+            chunker=chunker, doc_hash=doc_hash, load_doc=_load, **kwargs
+        )
+        if (
+            prov_index_store is not None
+            and doc_hash
+            and not prov_index_store.has(doc_hash)
+        ):
+            _load()  # cache hit, but index not yet built
+    # if not given, the hash was taken from the document, which got loaded then
+    return doc_hash or "", chunks
@@ -0,0 +1,9 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.conversion.merge import merge_dl_docs  # noqa
+from quackling.core.conversion.parallel_pdf_converter import (  # noqa
+    ParallelPDFConverter,
+)
@@ -0,0 +1,83 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from typing import Any, Sequence
+
+from docling_core.types import Document as DLDocument
+
+# collections that main-text items can point to, e.g. via '#/tables/0'
+_REF_COLLECTIONS = ["figures", "tables", "bitmaps", "equations", "footnotes"]
+_COLLECTIONS = [
+    "main-text",
+    *_REF_COLLECTIONS,
+    "page-dimensions",
+    "page-footers",
+    "page-headers",
+]
+
+
+def _shift_pages(obj: Any, offset: int) -> None:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "prov":
+                for prov in value if isinstance(value, list) else [value]:
+                    if prov is not None:
+                        prov["page"] += offset
+            else:
+                _shift_pages(value, offset)
+    elif isinstance(obj, list):
+        for value in obj:
+            _shift_pages(value, offset)
+
+
+def merge_dl_docs(
+    docs: Sequence[DLDocument], page_offsets: Sequence[int]
+) -> DLDocument:
+    """Merge documents converted from consecutive page ranges of the same file.
+
+    Items are concatenated in order, with main-text references re-pointed to the
+    merged collections and provenance page numbers shifted by each part's page
+    offset. Description and file info are taken from the first part.
+    """
+    if not docs or len(docs) != len(page_offsets):
+        raise ValueError("Expected one page offset for each of a non-empty docs list")
+
+    merged: dict[str, Any] = docs[0].model_dump(by_alias=True)
+    for key in _COLLECTIONS:
+        merged[key] = None
+    file_info = merged["file-info"]
+    file_info["page-hashes"] = None
+    num_pages: int | None = 0
+
+    for doc, offset in zip(docs, page_offsets):
+        part = doc.model_dump(by_alias=True)
+        ref_offsets = {key: len(merged[key] or []) for key in _REF_COLLECTIONS}
+        for item in part["main-text"] or []:
+            if "$ref" in item:
+                _, coll, pos = item["$ref"].split("/")  # e.g. '#/tables/0'
+                item["$ref"] = f"#/{coll}/{int(pos) + ref_offsets.get(coll, 0)}"
+        for key in _COLLECTIONS:
+            if part[key] is not None:
+                if key == "page-dimensions":
+                    for dims in part[key]:
+                        dims["page"] += offset
+                else:
+                    _shift_pages(part[key], offset)
+                merged[key] = (merged[key] or []) + part[key]
+
+        part_file_info = part["file-info"]
+        if part_file_info["page-hashes"] is not None:
+            for page_ref in part_file_info["page-hashes"]:
+                page_ref["page"] += offset
+            file_info["page-hashes"] = (
+                file_info["page-hashes"] or []
+            ) + part_file_info["page-hashes"]
+        if num_pages is not None and part_file_info["#-pages"] is not None:
+            num_pages += part_file_info["#-pages"]
+        else:
+            num_pages = None
+    file_info["#-pages"] = num_pages
+
+    return DLDocument.model_validate(merged)
@@ -0,0 +1,141 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable
+
+from docling_core.types import Document as DLDocument
+
+from quackling.core.conversion.merge import merge_dl_docs
+from quackling.core.sharding import source_hash
+
+_worker_converter: Any = None
+
+
+def _create_default_converter() -> Any:
+    from docling.document_converter import DocumentConverter
+
+    return DocumentConverter()
+
+
+def _limit_threads(num_threads: int) -> None:
+    # keep the workers' models from each using all CPUs
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(num_threads)
+
+
+def _init_worker(converter_factory: Callable[[], Any], num_threads: int) -> None:
+    global _worker_converter
+    _limit_threads(num_threads)
+    _worker_converter = converter_factory()
+
+
+def _convert(source: str) -> DLDocument:
+    return _worker_converter.convert_single(source).output
+
+
+class ParallelPDFConverter:
+    """Converts PDFs by splitting them into page ranges converted in parallel.
+
+    Each worker process creates its own converter via `converter_factory` (which
+    must be picklable, e.g. a module-level function) and reuses it across parts and
+    documents until the converter is closed. As each worker loads its own models,
+    the number of workers is kept small and the CPUs are split among them. Sources
+    that are not local files are converted as a whole.
+    """
+
+    def __init__(
+        self,
+        pages_per_part: int = 100,
+        max_workers: int = 4,
+        converter_factory: Callable[[], Any] = _create_default_converter,
+    ) -> None:
+        if pages_per_part < 1:
+            raise ValueError(f"Invalid {pages_per_part=}")
+        if max_workers < 1:
+            raise ValueError(f"Invalid {max_workers=}")
+        num_cpus = os.cpu_count() or 1
+        self._pages_per_part = pages_per_part
+        self._max_workers = min(max_workers, num_cpus)
+        self._threads_per_worker = max(1, num_cpus // self._max_workers)
+        self._converter_factory = converter_factory
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> ParallelPDFConverter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_init_worker,
+                initargs=(self._converter_factory, self._threads_per_worker),
+            )
+        return self._executor
+
+    def _split(self, path: Path, out_dir: str) -> tuple[list[Path], list[int]]:
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(path)
+        try:
+            num_pages = len(pdf)
+            part_paths: list[Path] = []
+            page_offsets = list(range(0, num_pages, self._pages_per_part))
+            for offset in page_offsets:
+                part = pdfium.PdfDocument.new()
+                part.import_pages(
+                    pdf,
+                    list(range(offset, min(offset + self._pages_per_part, num_pages))),
+                )
+                part_path = Path(out_dir) / f"{offset}.pdf"
+                part.save(part_path)
+                part.close()
+                part_paths.append(part_path)
+        finally:
+            pdf.close()
+        return part_paths, page_offsets
+
+    def convert(self, source: str | Path) -> DLDocument:
+        executor = self._get_executor()
+        path = Path(source)
+        if not path.is_file():
+            return executor.submit(_convert, str(source)).result()
+
+        with TemporaryDirectory() as tmp_dir:
+            part_paths, page_offsets = self._split(path=path, out_dir=tmp_dir)
+            if len(part_paths) == 1:
+                return executor.submit(_convert, str(path)).result()
+            futures = [executor.submit(_convert, str(p)) for p in part_paths]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # don't keep the pool busy with parts of a failed document
+                for future in futures:
+                    future.cancel()
+                raise
+            parts = [future.result() for future in futures]
+
+        dl_doc = merge_dl_docs(docs=parts, page_offsets=page_offsets)
+        dl_doc.file_info.filename = path.name
+        dl_doc.file_info.document_hash = source_hash(path)
+        return dl_doc
@@ -0,0 +1,6 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.ingestion.base import BaseBatchedWriter  # noqa
@@ -0,0 +1,155 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from itertools import islice
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import BaseModel, NonNegativeFloat, NonNegativeInt, PositiveInt
+
+_logger = logging.getLogger(__name__)
+
+_END = object()  # marks the end of a stage's input
+_POLL_INTERVAL = 0.1  # seconds
+
+
+class BaseBatchedWriter(BaseModel, ABC):
+    """Writes an item stream in batches through two concurrent stages.
+
+    A prepare stage (e.g. embedding) and a write stage run in their own threads,
+    connected by bounded queues, so that at most `max_pending_batches` batches are
+    buffered between stages and preparing a batch overlaps with writing the
+    previous one. Failed batches are retried on the transient errors in `retry_on`
+    (e.g. to be extended by a vector store client's connection errors).
+    """
+
+    batch_size: PositiveInt = 64
+    max_pending_batches: PositiveInt = 4
+    max_retries: NonNegativeInt = 3
+    retry_backoff: NonNegativeFloat = 0.5  # seconds, doubled on each retry
+    retry_on: tuple[type[Exception], ...] = (ConnectionError, TimeoutError)
+
+    def _prepare_batch(self, batch: list[Any]) -> list[Any]:
+        return batch
+
+    @abstractmethod
+    def _write_batch(self, batch: list[Any]) -> list[str]:
+        raise NotImplementedError()
+
+    def _call_with_retries(
+        self, func: Callable[[list[Any]], Any], batch: list[Any]
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return func(batch)
+            except self.retry_on as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                attempt += 1
+                _logger.warning(
+                    f"Batch of {len(batch)} failed ({e!r}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+    @classmethod
+    def _batched(cls, items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+        it = iter(items)
+        while batch := list(islice(it, size)):
+            yield batch
+
+    def _run_stage(
+        self,
+        func: Callable[[list[Any]], Any],
+        inp: "_StageQueue",
+        out: "_StageQueue | None",
+        results: list[str],
+    ) -> None:
+        try:
+            while (batch := inp.get()) is not _END:
+                res = self._call_with_retries(func, batch)
+                if out is not None:
+                    out.put(res)
+                else:
+                    results.extend(res)
+        except BaseException as e:
+            inp.fail(e)
+        finally:
+            if out is not None:
+                out.put(_END)
+
+    def write(self, items: Iterable[Any]) -> list[str]:
+        state = _PipelineState()
+        prepare_q = _StageQueue(state=state, maxsize=self.max_pending_batches)
+        write_q = _StageQueue(state=state, maxsize=self.max_pending_batches)
+        ids: list[str] = []
+
+        stages = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(self._prepare_batch, prepare_q, write_q, ids),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._run_stage,
+                args=(self._write_batch, write_q, None, ids),
+                daemon=True,
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+        try:
+            for batch in self._batched(items, self.batch_size):
+                if state.failed.is_set():
+                    break
+                prepare_q.put(batch)
+        finally:
+            prepare_q.put(_END)
+            for stage in stages:
+                stage.join()
+
+        if state.errors:
+            raise state.errors[0]
+        return ids
+
+
+class _PipelineState:
+    def __init__(self) -> None:
+        self.failed = threading.Event()
+        self.errors: list[BaseException] = []
+
+
+class _StageQueue:
+    """Bounded queue that stops blocking once any stage of the pipeline failed."""
+
+    def __init__(self, state: _PipelineState, maxsize: int) -> None:
+        self._state = state
+        self._queue: Queue = Queue(maxsize=maxsize)
+
+    def fail(self, error: BaseException) -> None:
+        self._state.errors.append(error)
+        self._state.failed.set()
+
+    def put(self, obj: Any) -> None:
+        while not self._state.failed.is_set():
+            try:
+                self._queue.put(obj, timeout=_POLL_INTERVAL)
+                return
+            except Full:
+                continue
+
+    def get(self) -> Any:
+        while not self._state.failed.is_set():
+            try:
+                return self._queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                continue
+        return _END
@@ -0,0 +1,15 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.io.docling_json import (  # noqa
+    Compression,
+    iter_dl_docs,
+    load_dl_doc,
+    read_bytes,
+    read_document_hash,
+    resolve_paths,
+    save_dl_doc,
+    write_bytes,
+)
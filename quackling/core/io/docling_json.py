@@ -0,0 +1,193 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import gzip
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from functools import cache
+from glob import glob, has_magic
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from docling_core.types import Document as DLDocument
+from pydantic import BaseModel, Field
+
+_READ_BLOCK_SIZE = 1 << 20
+
+
+class Compression(str, Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        return _COMPRESSION_SUFFIXES[self]
+
+    @classmethod
+    def from_path(cls, file_path: str | Path) -> "Compression":
+        name = str(file_path)
+        for compression, suffix in _COMPRESSION_SUFFIXES.items():
+            if suffix and name.endswith(suffix):
+                return compression
+        return cls.NONE
+
+
+_COMPRESSION_SUFFIXES = {
+    Compression.NONE: "",
+    Compression.GZIP: ".gz",
+    Compression.ZSTD: ".zst",
+}
+_JSON_SUFFIXES = tuple(f".json{suffix}" for suffix in _COMPRESSION_SUFFIXES.values())
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Handling zstd-compressed files requires `zstandard`, "
+            "e.g. `pip install quackling[zstd]`"
+        ) from e
+    return zstandard
+
+
+def _read_stream(stream: BufferedIOBase | BinaryIO) -> bytearray:
+    # decompress block-wise into a single buffer, avoiding intermediate copies
+    buf = bytearray()
+    while block := stream.read(_READ_BLOCK_SIZE):
+        buf += block
+    return buf
+
+
+def read_bytes(file_path: str | Path) -> bytes | bytearray:
+    """Read a file, transparently decompressing `.gz` / `.zst` files."""
+    compression = Compression.from_path(file_path)
+    if compression == Compression.GZIP:
+        with gzip.open(file_path, "rb") as stream:
+            return _read_stream(stream)
+    elif compression == Compression.ZSTD:
+        zstandard = _import_zstandard()
+        with open(file_path, "rb") as file_obj:
+            with zstandard.ZstdDecompressor().stream_reader(file_obj) as stream:
+                return _read_stream(stream)
+    else:
+        return Path(file_path).read_bytes()
+
+
+@cache
+def _default_file_mode() -> int:
+    # mode of newly created files as per the umask, which can only be read by
+    # setting it, so only done once
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _file_mode(path: Path) -> int:
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return _default_file_mode()
+
+
+def write_bytes(
+    file_path: str | Path,
+    data: bytes,
+    compression: Compression | None = None,
+) -> None:
+    """Atomically write a file, compressed as per `compression` or the file suffix."""
+    compression = compression or Compression.from_path(file_path)
+    path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file_obj:
+            if compression == Compression.GZIP:
+                with gzip.GzipFile(fileobj=file_obj, mode="wb", mtime=0) as stream:
+                    stream.write(data)
+            elif compression == Compression.ZSTD:
+                zstandard = _import_zstandard()
+                file_obj.write(zstandard.ZstdCompressor().compress(data))
+            else:
+                file_obj.write(data)
+            file_obj.flush()
+            # mkstemp() creates files only accessible by the owner
+            os.fchmod(file_obj.fileno(), _file_mode(path))
+            os.fsync(file_obj.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def resolve_paths(file_path: str | Path | Iterable[str | Path]) -> list[Path]:
+    """Expand files, directories (recursively) and glob patterns to file paths."""
+    sources = [file_path] if isinstance(file_path, (str, Path)) else file_path
+    paths: list[Path] = []
+    for source in sources:
+        if has_magic(str(source)):
+            paths.extend(Path(p) for p in sorted(glob(str(source), recursive=True)))
+        elif (dir_path := Path(source)).is_dir():
+            paths.extend(
+                p
+                for p in sorted(dir_path.rglob("*"))
+                if p.is_file() and p.name.endswith(_JSON_SUFFIXES)
+            )
+        else:
+            paths.append(Path(source))
+    return paths
+
+
+class _FileInfoHeader(BaseModel):
+    document_hash: str = Field(alias="document-hash")
+
+
+class _DocHeader(BaseModel):
+    file_info: _FileInfoHeader = Field(alias="file-info")
+
+
+def read_document_hash(file_path: str | Path) -> str:
+    """Read the document hash of a Docling JSON file without loading the document."""
+    return _DocHeader.model_validate_json(read_bytes(file_path)).file_info.document_hash
+
+
+def load_dl_doc(file_path: str | Path) -> DLDocument:
+    # validating the raw bytes avoids building an intermediate str / dict
+    return DLDocument.model_validate_json(read_bytes(file_path))
+
+
+def save_dl_doc(
+    dl_doc: DLDocument,
+    file_path: str | Path,
+    compression: Compression | None = None,
+) -> None:
+    write_bytes(
+        file_path=file_path,
+        data=dl_doc.model_dump_json().encode("utf-8"),
+        compression=compression,
+    )
+
+
+def iter_dl_docs(
+    file_paths: Iterable[str | Path],
+    max_workers: int = 4,
+    prefetch: int = 8,
+) -> Iterator[DLDocument]:
+    """Load Docling JSON files concurrently, yielding documents in input order.
+
+    At most `prefetch` documents are loaded ahead of the consumer.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[DLDocument]] = deque()
+        for path in file_paths:
+            pending.append(executor.submit(load_dl_doc, path))
+            if len(pending) >= prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
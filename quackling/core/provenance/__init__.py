@@ -0,0 +1,10 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.provenance.prov_index import (  # noqa
+    ProvenanceIndex,
+    ProvenanceIndexStore,
+    ProvenanceInfo,
+)
@@ -0,0 +1,158 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from __future__ import annotations
+
+import re
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+from docling_core.types import BoundingBox
+from docling_core.types import Document as DLDocument
+from pydantic import BaseModel
+
+from quackling.core.io import write_bytes
+
+_MAGIC = b"QPIX"
+_FORMAT_VERSION = 1
+_COLLECTIONS = ("main-text", "tables", "figures")  # as in chunk paths
+_HEADER = struct.Struct(f"<4sI{len(_COLLECTIONS)}I")
+_HEADER_SIZE = (_HEADER.size + 7) // 8 * 8  # rows start 8-byte aligned
+_ROW_DTYPE = np.dtype([("page", "<i4"), ("span", "<i4", (2,)), ("bbox", "<f8", (4,))])
+_PATH_PATTERN = re.compile(r"^\$\.([a-z-]+)\[(\d+)\]$")  # e.g. '$.main-text[12]'
+
+
+class ProvenanceInfo(BaseModel):
+    page: int
+    bbox: BoundingBox
+    span: list[int]  # character offsets of the item within its page cell(s)
+
+
+class ProvenanceIndex:
+    """Array-backed map from chunk paths to the first provenance of their item.
+
+    Rows are stored per collection in document order, so that a path like
+    `$.tables[3]` resolves in constant time to row `start(tables) + 3`. Saved
+    indexes are loaded as read-only memory maps.
+    """
+
+    def __init__(self, rows: np.ndarray, counts: tuple[int, ...]) -> None:
+        self._rows = rows
+        self._starts = dict(
+            zip(_COLLECTIONS, np.concatenate([[0], np.cumsum(counts)[:-1]]).tolist())
+        )
+        self._counts = dict(zip(_COLLECTIONS, counts))
+
+    @classmethod
+    def from_dl_doc(cls, dl_doc: DLDocument) -> ProvenanceIndex:
+        items_per_coll: list[Sequence[Any]] = [
+            dl_doc.main_text or [],
+            dl_doc.tables or [],
+            dl_doc.figures or [],
+        ]
+        counts = tuple(len(items) for items in items_per_coll)
+        rows = np.zeros(sum(counts), dtype=_ROW_DTYPE)
+        rows["page"] = -1  # i.e. no provenance, e.g. for main-text references
+        row_idx = 0
+        for items in items_per_coll:
+            for item in items:
+                if prov := getattr(item, "prov", None):
+                    rows[row_idx] = (prov[0].page, prov[0].span, prov[0].bbox)
+                row_idx += 1
+        return cls(rows=rows, counts=counts)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, *(self._counts[c] for c in _COLLECTIONS)
+        )
+        return header.ljust(_HEADER_SIZE, b"\0") + self._rows.tobytes()
+
+    def save(self, file_path: str | Path) -> None:
+        write_bytes(file_path=file_path, data=self.to_bytes())
+
+    @classmethod
+    def load(cls, file_path: str | Path) -> ProvenanceIndex:
+        with open(file_path, "rb") as file_obj:
+            magic, version, *counts = _HEADER.unpack(file_obj.read(_HEADER.size))
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(
+                f"Not a provenance index (v{_FORMAT_VERSION}): {file_path}"
+            )
+        rows = (
+            np.memmap(
+                file_path,
+                dtype=_ROW_DTYPE,
+                mode="r",
+                offset=_HEADER_SIZE,
+                shape=(sum(counts),),
+            )
+            if sum(counts)
+            else np.zeros(0, dtype=_ROW_DTYPE)
+        )
+        return cls(rows=rows, counts=tuple(counts))
+
+    def lookup(self, path: str) -> ProvenanceInfo | None:
+        if not (match := _PATH_PATTERN.match(path)):
+            return None
+        coll, pos = match.group(1), int(match.group(2))
+        if pos >= self._counts.get(coll, 0):
+            return None
+        row = self._rows[self._starts[coll] + pos]
+        if row["page"] < 0:
+            return None
+        return ProvenanceInfo(
+            page=int(row["page"]),
+            bbox=row["bbox"].tolist(),
+            span=row["span"].tolist(),
+        )
+
+
+class ProvenanceIndexStore:
+    """Directory of per-document provenance index sidecars, keyed by document hash."""
+
+    _SUFFIX = ".qpix"
+
+    def __init__(self, root_dir: str | Path, max_open_indexes: int = 64) -> None:
+        self._root_dir = Path(root_dir)
+        self._root_dir.mkdir(parents=True, exist_ok=True)
+        self._max_open_indexes = max_open_indexes
+        self._open_indexes: OrderedDict[str, ProvenanceIndex] = OrderedDict()
+
+    def _path_for(self, doc_hash: str) -> Path:
+        return self._root_dir / f"{doc_hash}{self._SUFFIX}"
+
+    def has(self, doc_hash: str) -> bool:
+        return self._path_for(doc_hash).exists()
+
+    def put(self, dl_doc: DLDocument) -> None:
+        doc_hash = dl_doc.file_info.document_hash
+        # the document hash identifies the source, i.e. an existing index is current
+        if not doc_hash or self.has(doc_hash):
+            return
+        ProvenanceIndex.from_dl_doc(dl_doc).save(self._path_for(doc_hash))
+        self._open_indexes.pop(doc_hash, None)
+
+    def _get_index(self, doc_hash: str) -> ProvenanceIndex | None:
+        if doc_hash in self._open_indexes:
+            self._open_indexes.move_to_end(doc_hash)
+            return self._open_indexes[doc_hash]
+        path = self._path_for(doc_hash)
+        if not path.exists():  # not cached, as it may get written later
+            return None
+        index = ProvenanceIndex.load(path)
+        self._open_indexes[doc_hash] = index
+        if len(self._open_indexes) > self._max_open_indexes:
+            self._open_indexes.popitem(last=False)
+        return index
+
+    def lookup(self, hits: Iterable[tuple[str, str]]) -> list[ProvenanceInfo | None]:
+        """Resolve (document hash, chunk path) pairs, e.g. of retrieval hits."""
+        return [
+            index.lookup(path) if (index := self._get_index(doc_hash)) else None
+            for doc_hash, path in hits
+        ]
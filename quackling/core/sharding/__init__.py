@@ -0,0 +1,11 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.core.sharding.lease import LeaseCoordinator  # noqa
+from quackling.core.sharding.partition import (  # noqa
+    select_shard,
+    shard_of,
+    source_hash,
+)
@@ -0,0 +1,192 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+_logger = logging.getLogger(__name__)
+
+
+class LeaseCoordinator:
+    """Coordinates document processing across workers through a shared directory.
+
+    A worker holds a document while its lock file exists and is kept fresh by
+    heartbeats; a lease whose lock file was not touched for `lease_ttl` seconds
+    (e.g. due to a crashed worker) can be taken over by another worker. Completed
+    documents get a marker file and are never claimed again.
+    """
+
+    _LEASE_SUFFIX = ".lease"
+    _DONE_SUFFIX = ".done"
+    _MAX_MISSED_HEARTBEATS = 3  # consecutive ticks without a lock file
+
+    def __init__(
+        self,
+        lease_dir: str | Path,
+        worker_id: str | None = None,
+        lease_ttl: float = 60.0,
+        heartbeat_interval: float | None = None,
+    ) -> None:
+        self._lease_dir = Path(lease_dir)
+        self._lease_dir.mkdir(parents=True, exist_ok=True)
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self._lease_ttl = lease_ttl
+        self._heartbeat_interval = (
+            heartbeat_interval if heartbeat_interval is not None else lease_ttl / 4
+        )
+        self._held: set[str] = set()
+        self._missed_heartbeats: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def _lease_path(self, key: str) -> Path:
+        return self._lease_dir / f"{key}{self._LEASE_SUFFIX}"
+
+    def _done_path(self, key: str) -> Path:
+        return self._lease_dir / f"{key}{self._DONE_SUFFIX}"
+
+    def _is_expired(self, path: Path) -> bool:
+        return path.stat().st_mtime + self._lease_ttl < time.time()
+
+    def _owns(self, key: str) -> bool:
+        try:
+            return self._lease_path(key).read_text() == self.worker_id
+        except FileNotFoundError:
+            return False
+
+    def is_done(self, key: str) -> bool:
+        return self._done_path(key).exists()
+
+    def _create_lease(self, key: str) -> bool:
+        try:
+            fd = os.open(self._lease_path(key), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as file_obj:
+            file_obj.write(self.worker_id)
+        # the lease may have been completed by its previous holder meanwhile
+        if self.is_done(key):
+            self._lease_path(key).unlink(missing_ok=True)
+            return False
+        return True
+
+    def _take_over_expired(self, key: str) -> bool:
+        lease_path = self._lease_path(key)
+        stale_path = lease_path.with_name(f"{lease_path.name}.{self.worker_id}")
+        try:
+            if not self._is_expired(lease_path):
+                return False
+            # rename is atomic, so only one of the competing workers moves it away
+            os.rename(lease_path, stale_path)
+        except FileNotFoundError:
+            return self._create_lease(key)
+        if not self._is_expired(stale_path):
+            # lease got renewed in the meantime, so put it back
+            try:
+                os.link(stale_path, lease_path)
+            except FileExistsError:
+                pass
+            stale_path.unlink()
+            return False
+        _logger.info(f"Taking over expired lease {lease_path.name}")
+        stale_path.unlink()
+        return self._create_lease(key)
+
+    def try_acquire(self, key: str) -> bool:
+        if self.is_done(key):
+            return False
+        acquired = self._create_lease(key) or self._take_over_expired(key)
+        if acquired:
+            with self._lock:
+                self._held.add(key)
+            self._ensure_heartbeat()
+        return acquired
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._held.discard(key)
+            self._missed_heartbeats.pop(key, None)
+        if self._owns(key):
+            self._lease_path(key).unlink(missing_ok=True)
+
+    def complete(self, key: str) -> None:
+        self._done_path(key).touch()
+        self.release(key)
+
+    @contextmanager
+    def lease(self, key: str) -> Iterator[bool]:
+        """Acquire the lease for the block, completing it only on success."""
+        acquired = self.try_acquire(key)
+        try:
+            yield acquired
+        except BaseException:
+            if acquired:
+                self.release(key)
+            raise
+        if acquired:
+            self.complete(key)
+
+    def _ensure_heartbeat(self) -> None:
+        with self._lock:
+            self._start_heartbeat()
+
+    def _start_heartbeat(self) -> None:
+        # to be called with self._lock held
+        if self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(
+                target=self._heartbeat, daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    def _renew(self, key: str) -> None:
+        lease_path = self._lease_path(key)
+        try:
+            owner = lease_path.read_text()
+            if owner == self.worker_id:
+                os.utime(lease_path)
+        except FileNotFoundError:
+            # possibly transient, e.g. while a competing worker checks for expiry
+            owner = None
+        with self._lock:
+            if key not in self._held:  # released meanwhile
+                return
+            if owner == self.worker_id:
+                self._missed_heartbeats.pop(key, None)
+                return
+            misses = self._missed_heartbeats.get(key, 0) + 1
+            if owner is None and misses < self._MAX_MISSED_HEARTBEATS:
+                self._missed_heartbeats[key] = misses
+                return
+            _logger.warning(f"Lost lease for {key=}")
+            self._held.discard(key)
+            self._missed_heartbeats.pop(key, None)
+
+    def _heartbeat(self) -> None:
+        try:
+            while True:
+                time.sleep(self._heartbeat_interval)
+                with self._lock:
+                    keys = list(self._held)
+                    if not keys:
+                        self._heartbeat_thread = None
+                        return
+                for key in keys:
+                    self._renew(key)
+        finally:
+            with self._lock:
+                if self._heartbeat_thread is threading.current_thread():
+                    # exiting unexpectedly, so hand over to a new thread
+                    self._heartbeat_thread = None
+                    if self._held:
+                        self._start_heartbeat()
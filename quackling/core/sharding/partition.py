@@ -0,0 +1,48 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+_BLOCK_SIZE = 1 << 20
+
+
+def source_hash(source: str | Path) -> str:
+    """Return the SHA-256 of a local file's content, or else of the source string.
+
+    For local files this matches the hash Docling uses as document hash.
+    """
+    hasher = hashlib.sha256()
+    path = Path(source)
+    if path.is_file():
+        with open(path, "rb") as file_obj:
+            while block := file_obj.read(_BLOCK_SIZE):
+                hasher.update(block)
+    else:
+        hasher.update(str(source).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def shard_of(key: str, num_shards: int) -> int:
+    # not using hash(), which is salted per process
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def select_shard(
+    items: Iterable[_T],
+    shard_index: int,
+    num_shards: int,
+    key: Callable[[_T], str] = source_hash,  # type: ignore[assignment]
+) -> Iterator[_T]:
+    """Yield the items assigned to the given shard, deterministically across nodes."""
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"Invalid shard {shard_index=} for {num_shards=}")
+    for item in items:
+        if num_shards == 1 or shard_of(key(item), num_shards) == shard_index:
+            yield item
@@ -0,0 +1,71 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import hashlib
+from pathlib import Path
+
+from docling_core.types import Document as DLDocument
+from pydantic import BaseModel, ValidationError
+
+from quackling.core.io import Compression, load_dl_doc, write_bytes
+
+_MAX_REF_LEN = 4096  # longer contents are taken to be serialized documents
+
+
+class DocumentRef(BaseModel):
+    dl_doc_hash: str
+    path: str
+
+
+class BlobStore:
+    """Local content-addressed store for serialized Docling documents.
+
+    Blobs are written atomically (temp file + rename), so concurrent writers and
+    readers never observe partial files.
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path,
+        compression: Compression = Compression.NONE,
+    ) -> None:
+        self._root_dir = Path(root_dir).resolve()
+        self._root_dir.mkdir(parents=True, exist_ok=True)
+        self._compression = compression
+
+    def _path_for(self, key: str) -> Path:
+        return self._root_dir / key[:2] / f"{key}.json{self._compression.suffix}"
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self._path_for(key)
+        if path.exists():  # content-addressed, i.e. already up to date
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes(file_path=path, data=data, compression=self._compression)
+        return path
+
+    def put_dl_doc(self, dl_doc: DLDocument) -> DocumentRef:
+        data = dl_doc.model_dump_json().encode("utf-8")
+        # keyed by content, as the document hash is the one of the source file
+        path = self.put(key=hashlib.sha256(data).hexdigest(), data=data)
+        return DocumentRef(dl_doc_hash=dl_doc.file_info.document_hash, path=str(path))
+
+    @classmethod
+    def load_dl_doc_from_content(
+        cls, content: str, blob_path: str | None = None
+    ) -> DLDocument:
+        """Load a document given as JSON or as `DocumentRef` to its stored blob."""
+        if blob_path is None and len(content) <= _MAX_REF_LEN:
+            try:
+                blob_path = DocumentRef.model_validate_json(content).path
+            except ValidationError:
+                pass
+        if blob_path is not None:
+            return cls.load_dl_doc(blob_path)
+        return DLDocument.model_validate_json(content)
+
+    @classmethod
+    def load_dl_doc(cls, path: str | Path) -> DLDocument:
+        return load_dl_doc(path)
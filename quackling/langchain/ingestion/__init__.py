@@ -0,0 +1,8 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.langchain.ingestion.vector_store_writer import (  # noqa
+    VectorStoreWriter,
+)
@@ -0,0 +1,62 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import inspect
+from typing import Any, Callable
+from uuid import uuid4
+
+from langchain_core.vectorstores import VectorStore
+from pydantic import ConfigDict, PrivateAttr, model_validator
+
+from quackling.core.ingestion import BaseBatchedWriter
+
+
+class VectorStoreWriter(BaseBatchedWriter):
+    """Adds documents to a vector store.
+
+    Document IDs are assigned before the first write attempt, so that retrying a
+    partially failed batch overwrites instead of duplicating its entries.
+
+    If the store accepts precomputed vectors via `add_embeddings(text_embeddings,
+    metadatas, ids)` (e.g. FAISS), documents are embedded in the prepare stage,
+    overlapping with writing the previous batch. Other stores embed documents on
+    insertion, i.e. within the write stage, so embedding and writing do not overlap.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector_store: VectorStore
+    _add_embeddings: Callable[..., list[str]] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _init_add_embeddings(self) -> "VectorStoreWriter":
+        add_embeddings = getattr(self.vector_store, "add_embeddings", None)
+        if (
+            self.vector_store.embeddings is not None
+            and add_embeddings is not None
+            and "text_embeddings" in inspect.signature(add_embeddings).parameters
+        ):
+            self._add_embeddings = add_embeddings
+        return self
+
+    def _prepare_batch(self, batch: list[Any]) -> list[Any]:
+        for doc in batch:
+            if not doc.id:
+                doc.id = str(uuid4())
+        if self._add_embeddings is None or self.vector_store.embeddings is None:
+            return batch
+        vectors = self.vector_store.embeddings.embed_documents(
+            [doc.page_content for doc in batch]
+        )
+        return list(zip(batch, vectors))
+
+    def _write_batch(self, batch: list[Any]) -> list[str]:
+        if self._add_embeddings is None:
+            return self.vector_store.add_documents(batch, ids=[doc.id for doc in batch])
+        return self._add_embeddings(
+            text_embeddings=[(doc.page_content, vector) for doc, vector in batch],
+            metadatas=[doc.metadata for doc, _ in batch],
+            ids=[doc.id for doc, _ in batch],
+        )
@@ -3,4 +3,5 @@
 # SPDX-License-Identifier: MIT
 #
 
+from quackling.langchain.loaders.docling_json_loader import DoclingJSONLoader  # noqa
 from quackling.langchain.loaders.docling_pdf_loader import DoclingPDFLoader  # noqa
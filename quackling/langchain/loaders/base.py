@@ -5,15 +5,18 @@
 
 from enum import Enum
 
-from docling.document_converter import DocumentConverter
 from docling_core.types import Document as DLDocument
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document as LCDocument
 from pydantic import BaseModel
 
+from quackling.core.io import Compression
+from quackling.core.storage import BlobStore
+
 
 class DocumentMetadata(BaseModel):
     dl_doc_hash: str
+    dl_doc_blob: str | None = None  # path of the out-of-line stored document
     # source: str
 
 
@@ -21,23 +24,42 @@ class BaseDoclingLoader(BaseLoader):
     class ParseType(str, Enum):
         MARKDOWN = "markdown"
         JSON = "json"
+        JSON_REF = "json_ref"  # JSON stored out of line, referenced by the doc
 
-    def __init__(self, file_path: str | list[str], parse_type: ParseType) -> None:
+    def __init__(
+        self,
+        file_path: str | list[str],
+        parse_type: ParseType,
+        blob_store_dir: str | None = None,
+        blob_compression: Compression = Compression.NONE,
+    ) -> None:
         self._file_paths = file_path if isinstance(file_path, list) else [file_path]
         self._parse_type = parse_type
-        self._converter = DocumentConverter()
+        if parse_type == self.ParseType.JSON_REF and blob_store_dir is None:
+            raise ValueError("Parse type `JSON_REF` requires `blob_store_dir`")
+        self._blob_store = (
+            BlobStore(root_dir=blob_store_dir, compression=blob_compression)
+            if blob_store_dir is not None
+            else None
+        )
 
     def _create_lc_doc_from_dl_doc(self, dl_doc: DLDocument) -> LCDocument:
+        dl_doc_blob: str | None = None
         if self._parse_type == self.ParseType.MARKDOWN:
             text = dl_doc.export_to_markdown()
         elif self._parse_type == self.ParseType.JSON:
             text = dl_doc.model_dump_json()
+        elif self._parse_type == self.ParseType.JSON_REF and self._blob_store:
+            doc_ref = self._blob_store.put_dl_doc(dl_doc)
+            text = doc_ref.model_dump_json()
+            dl_doc_blob = doc_ref.path
         else:
             raise RuntimeError(f"Unexpected parse type encountered: {self._parse_type}")
         lc_doc = LCDocument(
             page_content=text,
             metadata=DocumentMetadata(
                 dl_doc_hash=dl_doc.file_info.document_hash,
-            ).model_dump(),
+                dl_doc_blob=dl_doc_blob,
+            ).model_dump(exclude_none=True),
         )
         return lc_doc
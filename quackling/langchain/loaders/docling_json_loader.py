@@ -0,0 +1,41 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from typing import Iterator
+
+from langchain_core.documents import Document as LCDocument
+
+from quackling.core.io import Compression, iter_dl_docs, resolve_paths
+from quackling.langchain.loaders.base import BaseDoclingLoader
+
+
+class DoclingJSONLoader(BaseDoclingLoader):
+
+    def __init__(
+        self,
+        file_path: str | list[str],
+        parse_type: BaseDoclingLoader.ParseType,
+        blob_store_dir: str | None = None,
+        blob_compression: Compression = Compression.NONE,
+        max_workers: int = 4,
+        prefetch: int = 8,
+    ) -> None:
+        super().__init__(
+            file_path=file_path,
+            parse_type=parse_type,
+            blob_store_dir=blob_store_dir,
+            blob_compression=blob_compression,
+        )
+        self._max_workers = max_workers
+        self._prefetch = prefetch
+
+    def lazy_load(self) -> Iterator[LCDocument]:
+        for dl_doc in iter_dl_docs(
+            file_paths=resolve_paths(self._file_paths),
+            max_workers=self._max_workers,
+            prefetch=self._prefetch,
+        ):
+            lc_doc = self._create_lc_doc_from_dl_doc(dl_doc=dl_doc)
+            yield lc_doc
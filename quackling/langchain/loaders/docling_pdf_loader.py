@@ -7,11 +7,30 @@ from typing import Iterator
 
 from langchain_core.documents import Document as LCDocument
 
+from quackling.core.io import Compression
 from quackling.langchain.loaders.base import BaseDoclingLoader
 
 
 class DoclingPDFLoader(BaseDoclingLoader):
 
+    def __init__(
+        self,
+        file_path: str | list[str],
+        parse_type: BaseDoclingLoader.ParseType,
+        blob_store_dir: str | None = None,
+        blob_compression: Compression = Compression.NONE,
+    ) -> None:
+        # imported here so that loaders not needing a converter start up fast
+        from docling.document_converter import DocumentConverter
+
+        super().__init__(
+            file_path=file_path,
+            parse_type=parse_type,
+            blob_store_dir=blob_store_dir,
+            blob_compression=blob_compression,
+        )
+        self._converter = DocumentConverter()
+
     def lazy_load(self) -> Iterator[LCDocument]:
         for source in self._file_paths:
             dl_doc = self._converter.convert_single(source).output
@@ -9,8 +9,11 @@ from docling_core.types import Document as DLDocument
 from langchain_core.documents import Document as LCDocument
 from pydantic import BaseModel
 
+from quackling.core.cache import ChunkCache, chunk_document
 from quackling.core.chunkers.base import BaseChunker
 from quackling.core.chunkers.hierarchical_chunker import HierarchicalChunker
+from quackling.core.provenance import ProvenanceIndexStore
+from quackling.core.storage import BlobStore
 
 
 class ChunkDocMetadata(BaseModel):
@@ -23,21 +26,36 @@ class HierarchicalJSONSplitter:
     def __init__(
         self,
         chunker: BaseChunker | None = None,
+        chunk_cache: ChunkCache | None = None,
+        prov_index_store: ProvenanceIndexStore | None = None,
     ) -> None:
         self.chunker: BaseChunker = chunker or HierarchicalChunker()
+        self.chunk_cache = chunk_cache
+        self.prov_index_store = prov_index_store
+
+    def _load_dl_doc(self, lc_doc: LCDocument) -> DLDocument:
+        return BlobStore.load_dl_doc_from_content(
+            content=lc_doc.page_content,
+            blob_path=lc_doc.metadata.get("dl_doc_blob"),
+        )
 
     def split_documents(self, documents: Iterable[LCDocument]) -> List[LCDocument]:
 
         all_chunk_docs: list[LCDocument] = []
         for doc in documents:
             lc_doc: LCDocument = LCDocument.parse_obj(doc)
-            dl_doc: DLDocument = DLDocument.model_validate_json(lc_doc.page_content)
-            chunk_iter = self.chunker.chunk(dl_doc=dl_doc)
+            doc_hash, chunk_iter = chunk_document(
+                chunker=self.chunker,
+                doc_hash=lc_doc.metadata.get("dl_doc_hash"),
+                load_doc=lambda: self._load_dl_doc(lc_doc),
+                chunk_cache=self.chunk_cache,
+                prov_index_store=self.prov_index_store,
+            )
             chunk_docs = [
                 LCDocument(
                     page_content=chunk.text,
                     metadata=ChunkDocMetadata(
-                        dl_doc_id=dl_doc.file_info.document_hash,
+                        dl_doc_id=doc_hash,
                         path=chunk.path,
                     ).model_dump(),
                 )
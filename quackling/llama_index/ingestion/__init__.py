@@ -0,0 +1,9 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from quackling.llama_index.ingestion.streaming import run_streaming  # noqa
+from quackling.llama_index.ingestion.vector_store_writer import (  # noqa
+    VectorStoreWriter,
+)
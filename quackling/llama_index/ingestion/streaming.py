@@ -0,0 +1,31 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from llama_index.core.ingestion import IngestionPipeline
+from llama_index.core.schema import BaseNode
+from llama_index.core.schema import Document as LIDocument
+
+
+def run_streaming(
+    pipeline: IngestionPipeline,
+    documents: Iterable[LIDocument],
+    max_docs_in_flight: int = 16,
+    **kwargs: Any,
+) -> Iterator[BaseNode]:
+    """Run an ingestion pipeline over a document stream in bounded batches.
+
+    At most `max_docs_in_flight` documents (and the nodes derived from them) are
+    held at a time, so memory does not grow with the corpus size as long as the
+    yielded nodes are consumed incrementally, e.g. by a `VectorStoreWriter` or by
+    the pipeline's own vector store. Remaining kwargs are passed to `run()`.
+    """
+    if max_docs_in_flight < 1:
+        raise ValueError(f"Invalid {max_docs_in_flight=}")
+    doc_iter = iter(documents)
+    while batch := list(islice(doc_iter, max_docs_in_flight)):
+        yield from pipeline.run(documents=batch, **kwargs)
@@ -0,0 +1,39 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from typing import Any
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import BaseNode, MetadataMode
+from llama_index.core.vector_stores.types import BasePydanticVectorStore
+from pydantic import ConfigDict
+
+from quackling.core.ingestion import BaseBatchedWriter
+
+
+class VectorStoreWriter(BaseBatchedWriter):
+    """Embeds nodes (if not already embedded) and adds them to a vector store."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector_store: BasePydanticVectorStore
+    embed_model: BaseEmbedding | None = None
+
+    def _prepare_batch(self, batch: list[Any]) -> list[Any]:
+        to_embed: list[BaseNode] = [n for n in batch if n.embedding is None]
+        if not to_embed:
+            return batch
+        if self.embed_model is None:
+            # not worth retrying
+            raise ValueError("Nodes without embedding require `embed_model`")
+        embeddings = self.embed_model.get_text_embedding_batch(
+            [n.get_content(metadata_mode=MetadataMode.EMBED) for n in to_embed]
+        )
+        for node, embedding in zip(to_embed, embeddings):
+            node.embedding = embedding
+        return batch
+
+    def _write_batch(self, batch: list[Any]) -> list[str]:
+        return self.vector_store.add(batch)
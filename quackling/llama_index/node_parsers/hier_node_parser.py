@@ -5,7 +5,7 @@
 
 from datetime import datetime
 from random import Random
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Iterator, Sequence
 from uuid import UUID
 
 from docling_core.types import Document as DLDocument
@@ -18,10 +18,13 @@ from llama_index.core.schema import (
     TextNode,
 )
 from llama_index.core.utils import get_tqdm_iterable
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from typing_extensions import deprecated
 
+from quackling.core.cache import ChunkCache, chunk_document
 from quackling.core.chunkers import HierarchicalChunker
+from quackling.core.provenance import ProvenanceIndexStore
+from quackling.core.storage import BlobStore
 from quackling.llama_index.node_parsers.base import NodeMetadata
 
 
@@ -38,37 +41,77 @@ class HierarchicalNodeParser(NodeParser):
         default=None,
         description="ID generation seed; should typically be left to default `None`, which seeds on current timestamp; only set if you want the instance to generate a reproducible ID sequence e.g. for testing",  # noqa: 501
     )
+    chunk_cache: ChunkCache | None = Field(
+        default=None,
+        exclude=True,
+        description="Optional persistent cache of chunking results; documents whose hash and chunker config are cached are not re-parsed or re-chunked",  # noqa: 501
+    )
+    prov_index_store: ProvenanceIndexStore | None = Field(
+        default=None,
+        exclude=True,
+        description="Optional store of provenance indexes, written for each document parsed, for resolving citation geometry of chunk paths",  # noqa: 501
+    )
 
-    def _parse_nodes(
+    _id_gen: Random | None = PrivateAttr(default=None)
+
+    def _load_dl_doc(self, li_doc: LIDocument) -> DLDocument:
+        return BlobStore.load_dl_doc_from_content(
+            content=li_doc.get_content(),
+            blob_path=li_doc.metadata.get("dl_doc_blob"),
+        )
+
+    def _get_id_gen(self) -> Random:
+        # created once, so that repeated calls (e.g. one per batch of documents)
+        # continue the instance's ID sequence instead of repeating it
+        if self._id_gen is None:
+            seed = (
+                self.id_gen_seed
+                if self.id_gen_seed is not None
+                else datetime.now().timestamp()
+            )
+            self._id_gen = Random()
+            self._id_gen.seed(seed)
+        return self._id_gen
+
+    def stream_nodes(
         self,
-        nodes: Sequence[BaseNode],
+        nodes: Iterable[BaseNode],
         show_progress: bool = False,
-        **kwargs: Any,
-    ) -> list[BaseNode]:
+    ) -> Iterator[BaseNode]:
+        """Lazily parse the input documents one at a time, yielding their nodes.
+
+        Input documents are used as is, i.e. not copied, and only the document
+        currently being parsed is held, so that memory stays bounded when
+        consuming the nodes incrementally.
+        """
         # based on llama_index.core.node_parser.interface.TextSplitter
         nodes_with_progress: Iterable[BaseNode] = get_tqdm_iterable(
             items=nodes, show_progress=show_progress, desc="Parsing nodes"
         )
-        all_nodes: list[BaseNode] = []
         chunker = HierarchicalChunker()
         excl_meta_embed = NodeMetadata.ExcludedKeys.EMBED
         excl_meta_llm = NodeMetadata.ExcludedKeys.LLM
 
-        seed = (
-            self.id_gen_seed
-            if self.id_gen_seed is not None
-            else datetime.now().timestamp()
-        )
-        rd = Random()
-        rd.seed(seed)
+        rd = self._get_id_gen()
 
         for input_node in nodes_with_progress:
-            li_doc = LIDocument.model_validate(input_node)
-            dl_doc: DLDocument = DLDocument.model_validate_json(li_doc.get_content())
-            chunk_iter = chunker.chunk(dl_doc=dl_doc)
+            li_doc = (
+                input_node
+                if isinstance(input_node, LIDocument)
+                else LIDocument.model_validate(input_node)
+            )
+            _, chunk_iter = chunk_document(
+                chunker=chunker,
+                doc_hash=li_doc.metadata.get("dl_doc_hash"),
+                load_doc=lambda: self._load_dl_doc(li_doc),
+                chunk_cache=self.chunk_cache,
+                prov_index_store=self.prov_index_store,
+            )
+            # computed once per document, as it hashes the (possibly large) content
+            source_info = li_doc.as_related_node_info()
             for chunk in chunk_iter:
                 rels: dict[NodeRelationship, RelatedNodeType] = {
-                    NodeRelationship.SOURCE: li_doc.as_related_node_info(),
+                    NodeRelationship.SOURCE: source_info.model_copy(),
                 }
                 # based on llama_index.core.node_parser.node_utils.build_nodes_from_splits  # noqa
                 node = TextNode(
@@ -81,8 +124,15 @@ class HierarchicalNodeParser(NodeParser):
                 node.metadata = NodeMetadata(
                     path=chunk.path,
                 ).model_dump()
-                all_nodes.append(node)
-        return all_nodes
+                yield node
+
+    def _parse_nodes(
+        self,
+        nodes: Sequence[BaseNode],
+        show_progress: bool = False,
+        **kwargs: Any,
+    ) -> list[BaseNode]:
+        return list(self.stream_nodes(nodes=nodes, show_progress=show_progress))
 
 
 class HierarchicalJSONNodeParser(HierarchicalNodeParser):
@@ -4,22 +4,38 @@
 #
 
 from enum import Enum
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 from docling_core.types import Document as DLDocument
 from llama_index.core.readers.base import BasePydanticReader
 from llama_index.core.schema import Document as LIDocument
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    Field,
+    NonNegativeInt,
+    PositiveInt,
+    PrivateAttr,
+    model_validator,
+)
+
+from quackling.core.io import Compression
+from quackling.core.sharding import LeaseCoordinator, select_shard, source_hash
+from quackling.core.storage import BlobStore
 
 
 class DocumentMetadata(BaseModel):
     class ExcludedKeys:
         _COMMON = [
             "dl_doc_hash",
+            "dl_doc_blob",
         ]
         LLM = _COMMON
         EMBED = _COMMON
 
     dl_doc_hash: str
+    dl_doc_blob: str | None = None  # path of the out-of-line stored document
     # source: str
 
 
@@ -27,14 +43,108 @@ class BaseDoclingReader(BasePydanticReader):
     class ParseType(str, Enum):
         MARKDOWN = "markdown"
         JSON = "json"
+        JSON_REF = "json_ref"  # JSON stored out of line, referenced by the doc
 
     parse_type: ParseType = ParseType.MARKDOWN
+    blob_store_dir: str | None = Field(
+        default=None,
+        description="Directory for storing document JSON out of line; required for parse type `JSON_REF`",  # noqa: E501
+    )
+    blob_compression: Compression = Field(
+        default=Compression.NONE,
+        description="Compression of the document JSON stored out of line",
+    )
+    shard_index: NonNegativeInt = Field(
+        default=0,
+        description="Index of the shard of the input documents this reader handles",
+    )
+    num_shards: PositiveInt = Field(
+        default=1,
+        description="Number of shards the input documents are partitioned into by document hash",  # noqa: E501
+    )
+    lease_coordinator: LeaseCoordinator | None = Field(
+        default=None,
+        exclude=True,
+        description="Optional coordinator for claiming documents among several workers",  # noqa: E501
+    )
+    _blob_store: BlobStore | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _check_shard(self) -> "BaseDoclingReader":
+        if self.shard_index >= self.num_shards:
+            raise ValueError(f"Invalid {self.shard_index=} for {self.num_shards=}")
+        return self
+
+    @model_validator(mode="after")
+    def _init_blob_store(self) -> "BaseDoclingReader":
+        if self.parse_type == self.ParseType.JSON_REF and self.blob_store_dir is None:
+            raise ValueError("Parse type `JSON_REF` requires `blob_store_dir`")
+        if self.blob_store_dir is not None:
+            self._blob_store = BlobStore(
+                root_dir=self.blob_store_dir, compression=self.blob_compression
+            )
+        return self
+
+    def _source_key(self, source: str | Path) -> str:
+        """Return the document hash of a source, used for sharding and leasing."""
+        return source_hash(source)
+
+    def _claim_sources(
+        self, sources: Iterable[str | Path], claimed_keys: list[str]
+    ) -> Iterator[str | Path]:
+        if self.lease_coordinator is None:
+            yield from select_shard(
+                sources,
+                shard_index=self.shard_index,
+                num_shards=self.num_shards,
+                key=self._source_key,
+            )
+            return
+        keyed_sources = ((self._source_key(source), source) for source in sources)
+        for key, source in select_shard(
+            keyed_sources,
+            shard_index=self.shard_index,
+            num_shards=self.num_shards,
+            key=itemgetter(0),
+        ):
+            if self.lease_coordinator.try_acquire(key):
+                claimed_keys.append(key)
+                yield source
+
+    def _load_claimed_dl_docs(
+        self,
+        sources: Iterable[str | Path],
+        load_fn: Callable[[Iterable[str | Path]], Iterable[DLDocument]],
+    ) -> Iterator[DLDocument]:
+        """Load the documents of this reader's shard not yet claimed by others.
+
+        The leases of loaded documents stay held (kept alive by heartbeats) until
+        the caller completes them via `lease_coordinator.complete(dl_doc_hash)`
+        once the documents have been written to the sink. If loading fails or the
+        iteration is aborted, the leases not yet completed are released so that
+        the documents can be claimed again.
+        """
+        claimed_keys: list[str] = []
+        exhausted = False
+        try:
+            yield from load_fn(self._claim_sources(sources, claimed_keys))
+            exhausted = True
+        finally:
+            if self.lease_coordinator is not None and not exhausted:
+                for key in claimed_keys:
+                    if not self.lease_coordinator.is_done(key):
+                        self.lease_coordinator.release(key)
 
     def _create_li_doc_from_dl_doc(self, dl_doc: DLDocument) -> LIDocument:
+        dl_doc_blob: str | None = None
         if self.parse_type == self.ParseType.MARKDOWN:
             text = dl_doc.export_to_markdown()
         elif self.parse_type == self.ParseType.JSON:
             text = dl_doc.model_dump_json()
+        elif self.parse_type == self.ParseType.JSON_REF and self._blob_store:
+            doc_ref = self._blob_store.put_dl_doc(dl_doc)
+            text = doc_ref.model_dump_json()
+            dl_doc_blob = doc_ref.path
         else:
             raise RuntimeError(f"Unexpected parse type encountered: {self.parse_type}")
 
@@ -46,5 +156,6 @@ class BaseDoclingReader(BasePydanticReader):
         )
         li_doc.metadata = DocumentMetadata(
             dl_doc_hash=dl_doc.file_info.document_hash,
-        ).model_dump()
+            dl_doc_blob=dl_doc_blob,
+        ).model_dump(exclude_none=True)
         return li_doc
@@ -3,23 +3,32 @@
 # SPDX-License-Identifier: MIT
 #
 
-import json
+from pathlib import Path
 from typing import Iterable
 
-from docling_core.types import Document as DLDocument
 from llama_index.core.schema import Document as LIDocument
+from pydantic import PositiveInt
 
+from quackling.core.io import iter_dl_docs, read_document_hash, resolve_paths
 from quackling.llama_index.readers.base import BaseDoclingReader
 
 
 class DoclingJSONReader(BaseDoclingReader):
-    def lazy_load_data(self, file_path: str | list[str]) -> Iterable[LIDocument]:
+    max_workers: PositiveInt = 4
+    prefetch: PositiveInt = 8
 
-        file_paths = file_path if isinstance(file_path, list) else [file_path]
+    def _source_key(self, source: str | Path) -> str:
+        # as hashed from the original file (e.g. PDF) at conversion time
+        return read_document_hash(source) or super()._source_key(source)
 
-        for source in file_paths:
-            with open(source, encoding="utf-8") as file_obj:
-                data = json.load(file_obj)
-            dl_doc: DLDocument = DLDocument.model_validate(data)
+    def lazy_load_data(self, file_path: str | list[str]) -> Iterable[LIDocument]:
+        for dl_doc in self._load_claimed_dl_docs(
+            sources=resolve_paths(file_path),
+            load_fn=lambda paths: iter_dl_docs(
+                file_paths=paths,
+                max_workers=self.max_workers,
+                prefetch=self.prefetch,
+            ),
+        ):
             li_doc: LIDocument = self._create_li_doc_from_dl_doc(dl_doc=dl_doc)
             yield li_doc
@@ -7,19 +7,48 @@ from typing import Iterable
 
 from docling.document_converter import DocumentConverter
 from llama_index.core.schema import Document as LIDocument
+from pydantic import Field, PositiveInt
 from typing_extensions import deprecated
 
+from quackling.core.conversion import ParallelPDFConverter
 from quackling.llama_index.readers.base import BaseDoclingReader
 
 
 @deprecated("Use `quackling.llama_index.readers.DoclingPDFReader` instead.")
 class DoclingReader(BaseDoclingReader):
+    pages_per_part: PositiveInt | None = Field(
+        default=None,
+        description="If set, PDFs are split into page ranges of this size, converted in parallel worker processes",  # noqa: E501
+    )
+    max_workers: PositiveInt = Field(
+        default=4,
+        description="Max number of worker processes for page-range conversion, each loading its own models",  # noqa: E501
+    )
+
     def lazy_load_data(self, file_path: str | list[str]) -> Iterable[LIDocument]:
 
         file_paths = file_path if isinstance(file_path, list) else [file_path]
 
+        if self.pages_per_part is not None:
+            with ParallelPDFConverter(
+                pages_per_part=self.pages_per_part,
+                max_workers=self.max_workers,
+            ) as par_converter:
+                for dl_doc in self._load_claimed_dl_docs(
+                    sources=file_paths,
+                    load_fn=lambda sources: (
+                        par_converter.convert(source) for source in sources
+                    ),
+                ):
+                    yield self._create_li_doc_from_dl_doc(dl_doc=dl_doc)
+            return
+
         converter = DocumentConverter()
-        for source in file_paths:
-            dl_doc = converter.convert_single(source).output
+        for dl_doc in self._load_claimed_dl_docs(
+            sources=file_paths,
+            load_fn=lambda sources: (
+                converter.convert_single(source).output for source in sources
+            ),
+        ):
             li_doc = self._create_li_doc_from_dl_doc(dl_doc=dl_doc)
             yield li_doc
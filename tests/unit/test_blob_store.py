@@ -0,0 +1,75 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import json
+
+from docling_core.types import Document as DLDocument
+from llama_index.core.schema import Document as LIDocument
+
+from quackling.core.storage import BlobStore
+from quackling.langchain.loaders import DoclingJSONLoader
+from quackling.langchain.splitters import HierarchicalJSONSplitter
+from quackling.llama_index.node_parsers import HierarchicalJSONNodeParser
+
+_DL_DOC_PATH = "tests/unit/data/0_inp_dl_doc.json"
+
+
+def test_put_and_load(tmp_path):
+    with open(_DL_DOC_PATH) as f:
+        dl_doc = DLDocument.model_validate_json(f.read())
+    store = BlobStore(root_dir=tmp_path)
+    doc_ref = store.put_dl_doc(dl_doc)
+    assert store.put_dl_doc(dl_doc) == doc_ref
+    assert BlobStore.load_dl_doc(doc_ref.path) == dl_doc
+    assert [p.suffix for p in tmp_path.rglob("*") if p.is_file()] == [".json"]
+
+
+def test_put_same_document_hash(tmp_path):
+    with open(_DL_DOC_PATH) as f:
+        dl_doc = DLDocument.model_validate_json(f.read())
+    # e.g. the same source file re-converted with other options
+    other_dl_doc = dl_doc.model_copy(deep=True)
+    other_dl_doc.description.title = "Re-converted"
+
+    store = BlobStore(root_dir=tmp_path)
+    doc_ref = store.put_dl_doc(dl_doc)
+    other_doc_ref = store.put_dl_doc(other_dl_doc)
+    assert doc_ref.dl_doc_hash == other_doc_ref.dl_doc_hash
+    assert doc_ref.path != other_doc_ref.path
+    assert BlobStore.load_dl_doc(doc_ref.path) == dl_doc
+    assert BlobStore.load_dl_doc(other_doc_ref.path) == other_dl_doc
+
+
+def test_lc_json_ref(tmp_path):
+    kwargs = dict(file_path=_DL_DOC_PATH)
+    ref_docs = DoclingJSONLoader(
+        parse_type=DoclingJSONLoader.ParseType.JSON_REF,
+        blob_store_dir=str(tmp_path),
+        **kwargs,
+    ).load()
+    json_docs = DoclingJSONLoader(
+        parse_type=DoclingJSONLoader.ParseType.JSON, **kwargs
+    ).load()
+    assert len(ref_docs[0].page_content) < 1024
+    splitter = HierarchicalJSONSplitter()
+    assert splitter.split_documents(ref_docs) == splitter.split_documents(json_docs)
+
+
+def test_li_node_parse_json_ref(tmp_path):
+    with open("tests/unit/data/1_inp_li_doc.json") as f:
+        li_doc = LIDocument.from_json(f.read())
+    dl_doc = DLDocument.model_validate_json(li_doc.text)
+    doc_ref = BlobStore(root_dir=tmp_path).put_dl_doc(dl_doc)
+    li_doc.set_content(doc_ref.model_dump_json())
+    li_doc.metadata["dl_doc_blob"] = doc_ref.path
+    # e.g. after a transformation dropped the metadata
+    li_doc_wout_meta = LIDocument(text=li_doc.text)
+
+    with open("tests/unit/data/1_out_nodes.json") as f:
+        exp_data = json.load(fp=f)
+    for doc in (li_doc, li_doc_wout_meta):
+        node_parser = HierarchicalJSONNodeParser(id_gen_seed=42)
+        nodes = node_parser._parse_nodes(nodes=[doc])
+        assert [n["text"] for n in exp_data["root"]] == [n.text for n in nodes]
@@ -0,0 +1,91 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import json
+
+from docling_core.types import Document as DLDocument
+from llama_index.core.schema import Document as LIDocument
+
+from quackling.core.cache import ChunkCache, chunk_document
+from quackling.core.chunkers import HierarchicalChunker
+from quackling.llama_index.node_parsers import HierarchicalJSONNodeParser
+
+
+def _load_dl_doc() -> DLDocument:
+    with open("tests/unit/data/0_inp_dl_doc.json") as f:
+        return DLDocument.model_validate_json(f.read())
+
+
+def test_get_or_chunk(tmp_path):
+    chunker = HierarchicalChunker(include_metadata=True)
+    exp_chunks = list(chunker.chunk(dl_doc=_load_dl_doc()))
+
+    cache = ChunkCache(path=tmp_path / "cache.db")
+    chunks = cache.get_or_chunk(chunker=chunker, doc_hash="h0", load_doc=_load_dl_doc)
+    assert chunks == exp_chunks
+    cache.close()
+
+    # reopened cache must serve the chunks without loading the document
+    cache = ChunkCache(path=tmp_path / "cache.db")
+    chunks = cache.get_or_chunk(chunker=chunker, doc_hash="h0", load_doc=None)
+    assert chunks == exp_chunks
+
+    other_fingerprint = ChunkCache.fingerprint(HierarchicalChunker(min_chunk_len=1))
+    assert cache.get("h0", other_fingerprint) is None
+    assert ChunkCache.fingerprint(chunker) != ChunkCache.fingerprint(chunker, delim=" ")
+
+
+def test_chunk_document_without_hash(tmp_path):
+    def _load_hashed_dl_doc() -> DLDocument:
+        dl_doc = _load_dl_doc()
+        dl_doc.file_info.document_hash = "h0"
+        return dl_doc
+
+    chunker = HierarchicalChunker()
+    cache = ChunkCache(path=tmp_path / "cache.db")
+    assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    doc_hash, chunks = chunk_document(
+        chunker=chunker, doc_hash=None, load_doc=_load_hashed_dl_doc, chunk_cache=cache
+    )
+    assert doc_hash == "h0"
+    # cached under the hash of the loaded document
+    assert chunk_document(
+        chunker=chunker, doc_hash=doc_hash, load_doc=None, chunk_cache=cache
+    ) == (doc_hash, chunks)
+
+
+def test_evict_lru(tmp_path):
+    chunks = list(HierarchicalChunker().chunk(dl_doc=_load_dl_doc()))
+    cache = ChunkCache(path=tmp_path / "cache.db", max_entries=2)
+    cache.put("h0", "fp", chunks)
+    cache.put("h1", "fp", chunks)
+    assert cache.get("h0", "fp") is not None  # h1 now least recently used
+    cache.put("h2", "fp", chunks)
+    assert len(cache) == 2
+    assert cache.get("h1", "fp") is None
+    assert cache.get("h0", "fp") is not None
+
+    size_bounded_cache = ChunkCache(path=tmp_path / "cache2.db", max_size_bytes=1)
+    size_bounded_cache.put("h0", "fp", chunks)
+    assert len(size_bounded_cache) == 0
+    size_bounded_cache.compact()
+
+
+def test_node_parser_with_cache(tmp_path):
+    with open("tests/unit/data/1_inp_li_doc.json") as f:
+        li_doc = LIDocument.from_json(f.read())
+    li_doc.metadata["dl_doc_hash"] = "h0"
+    cache = ChunkCache(path=tmp_path / "cache.db")
+    node_parser = HierarchicalJSONNodeParser(id_gen_seed=42, chunk_cache=cache)
+    nodes = node_parser._parse_nodes(nodes=[li_doc])
+    assert len(cache) == 1
+
+    li_doc.set_content("not parseable anymore, so must be served from the cache")
+    cached_nodes = node_parser._parse_nodes(nodes=[li_doc])
+    assert [n.text for n in cached_nodes] == [n.text for n in nodes]
+
+    with open("tests/unit/data/1_out_nodes.json") as f:
+        exp_data = json.load(fp=f)
+    assert [n["text"] for n in exp_data["root"]] == [n.text for n in nodes]
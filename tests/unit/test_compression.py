@@ -0,0 +1,54 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import os
+
+import pytest
+
+from quackling.core.io import Compression, load_dl_doc, save_dl_doc
+from quackling.core.storage import BlobStore
+from quackling.langchain.loaders import DoclingJSONLoader
+
+_DL_DOC_PATH = "tests/unit/data/0_inp_dl_doc.json"
+
+
+@pytest.mark.parametrize("suffix", [".json.gz", ".json.zst"])
+def test_save_and_load(tmp_path, suffix):
+    if suffix.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    dl_doc = load_dl_doc(_DL_DOC_PATH)
+    file_path = tmp_path / f"doc{suffix}"
+    save_dl_doc(dl_doc, file_path)
+    assert file_path.stat().st_size < len(dl_doc.model_dump_json())
+    assert load_dl_doc(file_path) == dl_doc
+
+    loader = DoclingJSONLoader(
+        file_path=str(tmp_path), parse_type=DoclingJSONLoader.ParseType.JSON
+    )
+    lc_docs = loader.load()
+    assert len(lc_docs) == 1
+    assert lc_docs[0].page_content == dl_doc.model_dump_json()
+
+
+def test_compressed_blob_store(tmp_path):
+    dl_doc = load_dl_doc(_DL_DOC_PATH)
+    doc_ref = BlobStore(root_dir=tmp_path, compression=Compression.GZIP).put_dl_doc(
+        dl_doc
+    )
+    assert doc_ref.path.endswith(".json.gz")
+    assert BlobStore.load_dl_doc(doc_ref.path) == dl_doc
+
+
+def test_saved_file_mode(tmp_path):
+    dl_doc = load_dl_doc(_DL_DOC_PATH)
+    umask = os.umask(0o022)
+    os.umask(umask)
+    file_path = tmp_path / "doc.json"
+    save_dl_doc(dl_doc, file_path)
+    assert file_path.stat().st_mode & 0o777 == 0o666 & ~umask
+    # mode of an existing file is kept when overwriting it
+    file_path.chmod(0o640)
+    save_dl_doc(dl_doc, file_path)
+    assert file_path.stat().st_mode & 0o777 == 0o640
@@ -0,0 +1,32 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import shutil
+
+from quackling.langchain.loaders import DoclingJSONLoader
+
+
+def test_lazy_load():
+    loader = DoclingJSONLoader(
+        file_path="tests/unit/data/0_inp_dl_doc.json",
+        parse_type=DoclingJSONLoader.ParseType.JSON,
+    )
+    lc_docs = list(loader.lazy_load())
+    assert len(lc_docs) == 1
+    assert "dl_doc_hash" in lc_docs[0].metadata
+
+
+def test_lazy_load_dir_and_glob(tmp_path):
+    (tmp_path / "sub").mkdir()
+    shutil.copy("tests/unit/data/0_inp_dl_doc.json", tmp_path / "sub" / "a.json")
+    loader = DoclingJSONLoader(
+        file_path=[str(tmp_path), "tests/unit/data/0_inp_*.json"],
+        parse_type=DoclingJSONLoader.ParseType.MARKDOWN,
+        max_workers=2,
+        prefetch=1,
+    )
+    lc_docs = list(loader.lazy_load())
+    assert len(lc_docs) == 2
+    assert lc_docs[0].page_content == lc_docs[1].page_content
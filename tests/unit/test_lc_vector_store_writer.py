@@ -0,0 +1,84 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import json
+
+import pytest
+from langchain_core.documents import Document as LCDocument
+from langchain_core.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from quackling.langchain.ingestion import VectorStoreWriter
+from quackling.langchain.splitters import HierarchicalJSONSplitter
+
+
+class _FailingVectorStore(InMemoryVectorStore):
+    def add_documents(self, documents, ids=None, **kwargs):
+        raise ConnectionError("simulated write failure")
+
+
+class _PrecomputedVectorStore(InMemoryVectorStore):
+    """Accepts precomputed vectors, like e.g. FAISS."""
+
+    def add_documents(self, documents, ids=None, **kwargs):
+        raise AssertionError("documents should have been embedded beforehand")
+
+    def add_embeddings(self, text_embeddings, metadatas=None, ids=None, **kwargs):
+        for (text, vector), metadata, id_ in zip(text_embeddings, metadatas, ids):
+            self.store[id_] = {
+                "id": id_,
+                "vector": vector,
+                "text": text,
+                "metadata": metadata,
+            }
+        return ids
+
+
+def _get_docs():
+    with open("tests/unit/data/0_inp_dl_doc.json") as f:
+        lc_doc = LCDocument(page_content=json.dumps(json.load(f)))
+    return HierarchicalJSONSplitter().split_documents([lc_doc])
+
+
+def test_write():
+    docs = _get_docs()
+    vector_store = InMemoryVectorStore(embedding=FakeEmbeddings(size=8))
+    writer = VectorStoreWriter(vector_store=vector_store, batch_size=4)
+    ids = writer.write(iter(docs))
+    assert len(ids) == len(docs)
+    assert len(set(ids)) == len(ids)
+    assert len(vector_store.store) == len(docs)
+
+
+def test_write_raises_after_retries():
+    docs = _get_docs()
+    vector_store = _FailingVectorStore(embedding=FakeEmbeddings(size=8))
+    writer = VectorStoreWriter(
+        vector_store=vector_store, batch_size=4, max_retries=2, retry_backoff=0
+    )
+    with pytest.raises(ConnectionError):
+        writer.write(docs)
+
+
+def test_write_does_not_retry_non_transient_errors():
+    docs = _get_docs()
+    vector_store = _FailingVectorStore(embedding=FakeEmbeddings(size=8))
+    writer = VectorStoreWriter(
+        vector_store=vector_store, retry_backoff=60, retry_on=(TimeoutError,)
+    )
+    with pytest.raises(ConnectionError):
+        writer.write(docs)
+
+
+def test_write_precomputed_embeddings():
+    docs = _get_docs()
+    embedding = DeterministicFakeEmbedding(size=8)
+    vector_store = _PrecomputedVectorStore(embedding=embedding)
+    writer = VectorStoreWriter(vector_store=vector_store, batch_size=4)
+    ids = writer.write(docs)
+    assert len(ids) == len(docs)
+    assert [vector_store.store[id_]["vector"] for id_ in ids] == [
+        embedding.embed_query(doc.page_content) for doc in docs
+    ]
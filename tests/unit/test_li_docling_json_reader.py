@@ -3,12 +3,104 @@
 # SPDX-License-Identifier: MIT
 #
 
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from quackling.core.io import load_dl_doc, save_dl_doc
+from quackling.core.sharding import LeaseCoordinator
 from quackling.llama_index.readers import DoclingJSONReader
 
 
+def _create_docs(dir_path, num_docs) -> tuple[list[str], list[str]]:
+    dl_doc = load_dl_doc("tests/unit/data/0_inp_dl_doc.json")
+    paths: list[str] = []
+    hashes: list[str] = []
+    for i in range(num_docs):
+        dl_doc.file_info.document_hash = f"{i:064x}"
+        paths.append(str(dir_path / f"doc{i}.json"))
+        hashes.append(dl_doc.file_info.document_hash)
+        save_dl_doc(dl_doc, paths[-1])
+    return paths, hashes
+
+
 def test_lazy_load_data():
     reader = DoclingJSONReader(parse_type=DoclingJSONReader.ParseType.JSON)
 
     file_path = "tests/unit/data/0_inp_dl_doc.json"
     li_docs = list(reader.lazy_load_data(file_path))
     assert len(li_docs) == 1
+
+
+def test_lazy_load_data_sharded(tmp_path):
+    paths, hashes = _create_docs(tmp_path, num_docs=12)
+    shards = [
+        [
+            li_doc.metadata["dl_doc_hash"]
+            for li_doc in DoclingJSONReader(shard_index=i, num_shards=3).lazy_load_data(
+                paths
+            )
+        ]
+        for i in range(3)
+    ]
+    assert sorted(sum(shards, [])) == sorted(hashes)
+    # sharded by document hash, i.e. consistently with the PDF reader
+    assert DoclingJSONReader()._source_key(paths[0]) == hashes[0]
+
+    with pytest.raises(ValueError):
+        DoclingJSONReader(shard_index=1, num_shards=1)
+
+
+def test_lazy_load_data_leased(tmp_path):
+    paths, hashes = _create_docs(tmp_path, num_docs=4)
+    coordinator = LeaseCoordinator(lease_dir=tmp_path / "leases")
+    reader = DoclingJSONReader(lease_coordinator=coordinator, prefetch=2)
+
+    # loaded documents stay leased until the caller has written and completed them
+    li_docs = list(reader.lazy_load_data(paths))
+    assert [d.metadata["dl_doc_hash"] for d in li_docs] == hashes
+    assert not any(coordinator.is_done(h) for h in hashes)
+    assert not list(reader.lazy_load_data(paths))
+
+    for li_doc in li_docs[:2]:
+        coordinator.complete(li_doc.metadata["dl_doc_hash"])
+    for li_doc in li_docs[2:]:
+        coordinator.release(li_doc.metadata["dl_doc_hash"])
+    li_docs = list(reader.lazy_load_data(paths))
+    assert [d.metadata["dl_doc_hash"] for d in li_docs] == hashes[2:]
+
+
+def test_lazy_load_data_leased_consumer_fails(tmp_path):
+    paths, hashes = _create_docs(tmp_path, num_docs=4)
+    coordinator = LeaseCoordinator(lease_dir=tmp_path / "leases")
+    reader = DoclingJSONReader(lease_coordinator=coordinator, prefetch=2)
+
+    li_doc_iter = reader.lazy_load_data(paths)
+    batch = list(islice(li_doc_iter, 3))
+    coordinator.complete(batch[0].metadata["dl_doc_hash"])
+    # writing the rest of the batch fails, so the consumer aborts the iteration
+    li_doc_iter.close()  # type: ignore[attr-defined]
+    assert not list((tmp_path / "leases").glob("*.lease"))
+    assert not any(coordinator.is_done(h) for h in hashes[1:])
+
+    # another worker claims everything not written yet
+    other_reader = DoclingJSONReader(
+        lease_coordinator=LeaseCoordinator(lease_dir=tmp_path / "leases")
+    )
+    li_docs = list(other_reader.lazy_load_data(paths))
+    assert [d.metadata["dl_doc_hash"] for d in li_docs] == hashes[1:]
+
+
+def test_lazy_load_data_json_ref(tmp_path):
+    with pytest.raises(ValueError):
+        DoclingJSONReader(parse_type=DoclingJSONReader.ParseType.JSON_REF)
+
+    paths, hashes = _create_docs(tmp_path, num_docs=2)
+    reader = DoclingJSONReader(
+        parse_type=DoclingJSONReader.ParseType.JSON_REF,
+        blob_store_dir=str(tmp_path / "blobs"),
+    )
+    li_docs = list(reader.lazy_load_data(paths))
+    assert [d.metadata["dl_doc_hash"] for d in li_docs] == hashes
+    assert all(Path(d.metadata["dl_doc_blob"]).is_file() for d in li_docs)
@@ -0,0 +1,72 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import json
+
+from llama_index.core.ingestion import IngestionPipeline
+from llama_index.core.schema import Document as LIDocument
+
+from quackling.llama_index.ingestion import run_streaming
+from quackling.llama_index.node_parsers import HierarchicalJSONNodeParser
+
+
+def _load_li_doc() -> LIDocument:
+    with open("tests/unit/data/1_inp_li_doc.json") as f:
+        return LIDocument.from_json(f.read())
+
+
+def _counting(docs, consumed):
+    for doc in docs:
+        consumed.append(doc)
+        yield doc
+
+
+def test_stream_nodes():
+    consumed: list[LIDocument] = []
+    li_docs = [_load_li_doc() for _ in range(3)]
+    node_parser = HierarchicalJSONNodeParser(id_gen_seed=42)
+    node_iter = node_parser.stream_nodes(nodes=_counting(li_docs, consumed))
+    first_node = next(node_iter)
+    assert len(consumed) == 1
+    nodes = [first_node] + list(node_iter)
+
+    with open("tests/unit/data/1_out_nodes.json") as f:
+        exp_data = json.load(fp=f)
+    num_exp = len(exp_data["root"])
+    assert len(nodes) == 3 * num_exp
+    act_data = dict(root=[n.dict() for n in nodes[:num_exp]])
+    assert exp_data == act_data
+
+
+def test_run_streaming():
+    consumed: list[LIDocument] = []
+    li_docs = [_load_li_doc() for _ in range(5)]
+    for i, li_doc in enumerate(li_docs):  # distinct, i.e. no pipeline cache hits
+        li_doc.metadata["dl_doc_hash"] = f"{i}"
+    pipeline = IngestionPipeline(
+        transformations=[HierarchicalJSONNodeParser(id_gen_seed=42)]
+    )
+    node_iter = run_streaming(
+        pipeline=pipeline,
+        documents=_counting(li_docs, consumed),
+        max_docs_in_flight=2,
+    )
+    first_node = next(node_iter)
+    assert len(consumed) == 2
+    nodes = [first_node] + list(node_iter)
+    assert len(consumed) == 5
+    assert len(nodes) == 5 * len(pipeline.run(documents=li_docs[:1]))
+    assert len({n.node_id for n in nodes}) == len(nodes)
+
+
+def test_id_sequence_continues_across_calls():
+    li_doc = _load_li_doc()
+    node_parser = HierarchicalJSONNodeParser(id_gen_seed=42)
+    ids = [n.node_id for n in node_parser._parse_nodes(nodes=[li_doc, li_doc])]
+    node_parser = HierarchicalJSONNodeParser(id_gen_seed=42)
+    split_ids = [
+        n.node_id for _ in range(2) for n in node_parser._parse_nodes(nodes=[li_doc])
+    ]
+    assert split_ids == ids
@@ -0,0 +1,66 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import pytest
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import Document as LIDocument
+from llama_index.core.vector_stores import SimpleVectorStore
+from pydantic import PrivateAttr
+
+from quackling.llama_index.ingestion import VectorStoreWriter
+from quackling.llama_index.node_parsers import HierarchicalJSONNodeParser
+
+
+class _FlakyVectorStore(SimpleVectorStore):
+    _failures_left: int = PrivateAttr(default=1)
+
+    def add(self, nodes, **kwargs):
+        if self._failures_left > 0:
+            self._failures_left -= 1
+            raise ConnectionError("simulated write failure")
+        return super().add(nodes, **kwargs)
+
+
+def _get_nodes():
+    with open("tests/unit/data/1_inp_li_doc.json") as f:
+        li_doc = LIDocument.from_json(f.read())
+    node_parser = HierarchicalJSONNodeParser(id_gen_seed=42)
+    return node_parser._parse_nodes(nodes=[li_doc])
+
+
+def test_write():
+    nodes = _get_nodes()
+    vector_store = SimpleVectorStore()
+    writer = VectorStoreWriter(
+        vector_store=vector_store,
+        embed_model=MockEmbedding(embed_dim=8),
+        batch_size=5,
+        max_pending_batches=1,
+    )
+    ids = writer.write(iter(nodes))
+    assert ids == [n.node_id for n in nodes]
+    assert set(vector_store.data.embedding_dict) == set(ids)
+
+
+def test_write_retries_failed_batch():
+    nodes = _get_nodes()
+    vector_store = _FlakyVectorStore()
+    writer = VectorStoreWriter(
+        vector_store=vector_store,
+        embed_model=MockEmbedding(embed_dim=8),
+        batch_size=5,
+        retry_backoff=0,
+    )
+    ids = writer.write(nodes)
+    assert len(ids) == len(nodes)
+    assert len(vector_store.data.embedding_dict) == len(nodes)
+
+
+def test_write_without_embed_model():
+    nodes = _get_nodes()
+    writer = VectorStoreWriter(vector_store=SimpleVectorStore(), retry_backoff=60)
+    # failing right away, as retrying would not help
+    with pytest.raises(ValueError, match="embed_model"):
+        writer.write(nodes)
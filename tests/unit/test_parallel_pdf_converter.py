@@ -0,0 +1,169 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+from pathlib import Path
+
+import pytest
+from docling_core.types import Document as DLDocument
+
+from quackling.core.chunkers import HierarchicalChunker
+from quackling.core.conversion import ParallelPDFConverter
+from quackling.core.sharding import source_hash
+
+pdfium = pytest.importorskip("pypdfium2")
+
+_NUM_PAGES = 7
+
+
+class _StubResult:
+    def __init__(self, output: DLDocument) -> None:
+        self.output = output
+
+
+class _StubConverter:
+    """Emits a subtitle, a paragraph, a list and (on even pages) a table per page.
+
+    Like a real converter, provenance is numbered relative to the converted file;
+    the original page number is recovered from the page width for the texts.
+    """
+
+    def convert_single(self, source: str) -> _StubResult:
+        pdf = pdfium.PdfDocument(source)
+        sizes = [pdf[i].get_size() for i in range(len(pdf))]
+        pdf.close()
+        main_text: list[dict] = []
+        tables: list[dict] = []
+        for i, (width, height) in enumerate(sizes):
+            page_no = int(width) - 100
+            prov = [{"bbox": [0.0, 1.0, 2.0, 3.0], "page": i + 1, "span": [0, 1]}]
+            main_text.append(
+                {
+                    "text": f"Section {page_no}",
+                    "type": "subtitle-level-1",
+                    "name": "Section-header",
+                    "prov": prov,
+                }
+            )
+            main_text.append(
+                {
+                    "text": f"Paragraph on page {page_no}, long enough to be a chunk.",
+                    "type": "paragraph",
+                    "name": "Text",
+                    "prov": prov,
+                }
+            )
+            main_text.append(
+                {
+                    "text": f"A list on page {page_no} follows:",
+                    "type": "paragraph",
+                    "name": "Text",
+                    "prov": prov,
+                }
+            )
+            for j in range(2):
+                main_text.append(
+                    {
+                        "text": f"list item {j} with enough text in it",
+                        "type": "paragraph",
+                        "name": "List-item",
+                        "prov": prov,
+                    }
+                )
+            if page_no % 2 == 0:
+                main_text.append(
+                    {
+                        "name": "Table",
+                        "type": "table",
+                        "$ref": f"#/tables/{len(tables)}",
+                    }
+                )
+                tables.append(
+                    {
+                        "type": "table",
+                        "num_cols": 2,
+                        "num_rows": 2,
+                        "prov": prov,
+                        "data": [
+                            [
+                                {"text": "", "type": "body"},
+                                {"text": "col", "type": "col_header"},
+                            ],
+                            [
+                                {"text": f"row {page_no}", "type": "row_header"},
+                                {"text": f"{page_no}", "type": "body"},
+                            ],
+                        ],
+                    }
+                )
+        return _StubResult(
+            DLDocument.model_validate(
+                {
+                    "_name": "",
+                    "description": {"logs": []},
+                    "file-info": {
+                        "filename": Path(source).name,
+                        "document-hash": source_hash(source),
+                        "#-pages": len(sizes),
+                    },
+                    "main-text": main_text,
+                    "tables": tables,
+                    "page-dimensions": [
+                        {"page": i + 1, "width": w, "height": h}
+                        for i, (w, h) in enumerate(sizes)
+                    ],
+                }
+            )
+        )
+
+
+def _create_stub_converter() -> _StubConverter:
+    return _StubConverter()
+
+
+def _create_pdf(pdf_path: Path, num_pages: int = _NUM_PAGES) -> None:
+    pdf = pdfium.PdfDocument.new()
+    for page_no in range(1, num_pages + 1):
+        pdf.new_page(100 + page_no, 200)
+    pdf.save(pdf_path)
+    pdf.close()
+
+
+def test_convert_matches_sequential(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _create_pdf(pdf_path)
+
+    exp_doc = _StubConverter().convert_single(str(pdf_path)).output
+    with ParallelPDFConverter(
+        pages_per_part=3, max_workers=2, converter_factory=_create_stub_converter
+    ) as converter:
+        act_doc = converter.convert(pdf_path)
+
+    assert act_doc.model_dump() == exp_doc.model_dump()
+    chunker = HierarchicalChunker()
+    assert list(chunker.chunk(act_doc)) == list(chunker.chunk(exp_doc))
+
+
+class _FailingConverter(_StubConverter):
+    def convert_single(self, source: str) -> _StubResult:
+        if Path(source).name == "0.pdf":
+            raise RuntimeError("conversion failed")
+        return super().convert_single(source)
+
+
+def _create_failing_converter() -> _FailingConverter:
+    return _FailingConverter()
+
+
+def test_convert_part_fails(tmp_path):
+    _create_pdf(tmp_path / "doc.pdf")
+    _create_pdf(tmp_path / "single.pdf", num_pages=1)
+    with ParallelPDFConverter(
+        pages_per_part=2, max_workers=1, converter_factory=_create_failing_converter
+    ) as converter:
+        with pytest.raises(RuntimeError, match="conversion failed"):
+            converter.convert(tmp_path / "doc.pdf")
+        # the pool remains usable for further documents
+        dl_doc = converter.convert(tmp_path / "single.pdf")
+    assert dl_doc.file_info.filename == "single.pdf"
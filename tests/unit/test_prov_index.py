@@ -0,0 +1,76 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import os
+
+from docling_core.types import Document as DLDocument
+from langchain_core.documents import Document as LCDocument
+
+from quackling.core.cache import ChunkCache
+from quackling.core.chunkers import HierarchicalChunker
+from quackling.core.provenance import ProvenanceIndex, ProvenanceIndexStore
+from quackling.langchain.splitters import HierarchicalJSONSplitter
+
+
+def _load_dl_doc() -> DLDocument:
+    with open("tests/unit/data/0_inp_dl_doc.json") as f:
+        dl_doc: DLDocument = DLDocument.model_validate_json(f.read())
+    dl_doc.file_info.document_hash = "h0"
+    return dl_doc
+
+
+def test_lookup_matches_chunk_metadata(tmp_path):
+    dl_doc = _load_dl_doc()
+    ProvenanceIndex.from_dl_doc(dl_doc).save(tmp_path / "h0.qpix")
+    index = ProvenanceIndex.load(tmp_path / "h0.qpix")
+
+    chunks = list(HierarchicalChunker(include_metadata=True).chunk(dl_doc))
+    assert chunks
+    for chunk in chunks:
+        prov = index.lookup(chunk.path)
+        assert (prov.page, prov.bbox) == (chunk.page, chunk.bbox)
+    assert index.lookup("$.main-text[100000]") is None
+    assert index.lookup("description.title") is None
+
+
+def test_store_built_while_splitting(tmp_path):
+    dl_doc = _load_dl_doc()
+    store = ProvenanceIndexStore(root_dir=tmp_path)
+    splitter = HierarchicalJSONSplitter(prov_index_store=store)
+    chunk_docs = splitter.split_documents(
+        [LCDocument(page_content=dl_doc.model_dump_json())]
+    )
+
+    hits = [(d.metadata["dl_doc_id"], d.metadata["path"]) for d in chunk_docs]
+    provs = ProvenanceIndexStore(root_dir=tmp_path).lookup(hits + [("h1", "$.x[0]")])
+    assert all(p is not None for p in provs[:-1])
+    assert provs[-1] is None
+
+
+def test_store_built_on_chunk_cache_hit(tmp_path):
+    dl_doc = _load_dl_doc()
+    lc_doc = LCDocument(
+        page_content=dl_doc.model_dump_json(), metadata={"dl_doc_hash": "h0"}
+    )
+    chunk_cache = ChunkCache(path=tmp_path / "cache.db")
+    HierarchicalJSONSplitter(chunk_cache=chunk_cache).split_documents([lc_doc])
+
+    store = ProvenanceIndexStore(root_dir=tmp_path / "prov")
+    assert store.lookup([("h0", "$.main-text[0]")]) == [None]  # miss not cached
+    splitter = HierarchicalJSONSplitter(chunk_cache=chunk_cache, prov_index_store=store)
+    chunk_docs = splitter.split_documents([lc_doc])
+    hits = [(d.metadata["dl_doc_id"], d.metadata["path"]) for d in chunk_docs]
+    assert all(p is not None for p in store.lookup(hits))
+
+
+def test_store_put_skips_existing(tmp_path):
+    dl_doc = _load_dl_doc()
+    store = ProvenanceIndexStore(root_dir=tmp_path)
+    store.put(dl_doc)
+    path = tmp_path / "h0.qpix"
+    mtime_ns = path.stat().st_mtime_ns
+    os.utime(path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+    store.put(dl_doc)
+    assert path.stat().st_mtime_ns == mtime_ns - 10**9
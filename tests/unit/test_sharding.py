@@ -0,0 +1,92 @@
+#
+# Copyright IBM Corp. 2024 - 2024
+# SPDX-License-Identifier: MIT
+#
+
+import multiprocessing
+import os
+import time
+
+from quackling.core.sharding import LeaseCoordinator, select_shard, source_hash
+
+_KEYS = [f"doc{i}" for i in range(40)]
+
+
+def _process_all(lease_dir, out_path):
+    coordinator = LeaseCoordinator(lease_dir=lease_dir, lease_ttl=5)
+    with open(out_path, "w") as f:
+        for key in _KEYS:
+            with coordinator.lease(key) as acquired:
+                if acquired:
+                    time.sleep(0.005)
+                    f.write(f"{key}\n")
+
+
+def test_select_shard():
+    items = [f"https://example.com/{i}.pdf" for i in range(100)]
+    shards = [list(select_shard(items, i, 3)) for i in range(3)]
+    assert sorted(sum(shards, [])) == sorted(items)
+    assert shards == [list(select_shard(items, i, 3)) for i in range(3)]
+    assert source_hash("tests/unit/data/0_inp_dl_doc.json") != source_hash(
+        "tests/unit/data/1_inp_li_doc.json"
+    )
+
+
+def test_lease_expiry(tmp_path):
+    crashed = LeaseCoordinator(lease_dir=tmp_path, lease_ttl=60)
+    other = LeaseCoordinator(lease_dir=tmp_path, lease_ttl=60)
+    assert crashed.try_acquire("doc0")
+    assert not other.try_acquire("doc0")
+
+    # simulate a worker that stopped sending heartbeats long ago
+    lease_path = tmp_path / "doc0.lease"
+    os.utime(lease_path, (time.time() - 120, time.time() - 120))
+    assert other.try_acquire("doc0")
+    other.complete("doc0")
+    assert not crashed.try_acquire("doc0")
+    assert not lease_path.exists()
+
+
+def test_multi_process_claims(tmp_path):
+    out_paths = [tmp_path / f"out{i}.txt" for i in range(4)]
+    procs = [
+        multiprocessing.Process(target=_process_all, args=(tmp_path / "leases", p))
+        for p in out_paths
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+        assert proc.exitcode == 0
+    processed = [line for p in out_paths for line in p.read_text().splitlines()]
+    assert sorted(processed) == sorted(_KEYS)
+
+
+def test_heartbeat_survives_transient_and_lost_leases(tmp_path):
+    # heartbeat ticks are driven manually instead of by the background thread
+    coordinator = LeaseCoordinator(
+        lease_dir=tmp_path, lease_ttl=60, heartbeat_interval=3600
+    )
+    other = LeaseCoordinator(lease_dir=tmp_path, lease_ttl=60)
+    assert coordinator.try_acquire("doc0")
+    assert coordinator.try_acquire("doc1")
+    long_ago = time.time() - 120
+
+    # lock file briefly gone, as during a competitor's expiry check
+    lease_path = tmp_path / "doc0.lease"
+    os.rename(lease_path, tmp_path / "moved")
+    coordinator._renew("doc0")
+    os.rename(tmp_path / "moved", lease_path)
+    os.utime(lease_path, (long_ago, long_ago))
+    coordinator._renew("doc0")
+    assert lease_path.stat().st_mtime > long_ago
+    assert not other.try_acquire("doc0")
+
+    # lock file gone for good
+    (tmp_path / "doc1.lease").unlink()
+    for _ in range(LeaseCoordinator._MAX_MISSED_HEARTBEATS - 1):
+        coordinator._renew("doc1")
+    assert coordinator._held == {"doc0", "doc1"}
+    coordinator._renew("doc1")
+    assert coordinator._held == {"doc0"}
+    assert other.try_acquire("doc1")